@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import inspect
 import json
 import logging
+import ssl
 import typing
 
+import certifi
 import httpx
 import tenacity
 
@@ -18,17 +21,43 @@ from rossum_api.domain_logic.urls import (
 )
 
 if typing.TYPE_CHECKING:
-    from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+    from typing import (
+        Any,
+        AsyncIterator,
+        BinaryIO,
+        Dict,
+        Iterable,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+        Union,
+    )
 
     from aiofiles.threadpool.binary import AsyncBufferedReader
 
     from rossum_api.domain_logic.resources import Resource
 
 
-RETRIED_HTTP_CODES = (408, 429, 500, 502, 503, 504)
+RETRIED_HTTP_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# Keep idle connections around longer than the httpx default (5 s) so that requests issued in
+# bursts with short pauses in between (e.g. polling) reuse a connection instead of paying
+# DNS lookup and TCP + TLS handshake again.
+KEEPALIVE_EXPIRY_S = 30.0
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _default_ssl_context(http2: bool) -> ssl.SSLContext:
+    """Build the SSL context once per process and share it among clients with the same ``http2``.
+
+    Loading the CA bundle is the most expensive part of creating an httpx client. httpcore sets
+    the ALPN protocols on the context for every new connection, so HTTP/1.1-only and HTTP/2
+    clients must not share it.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 class APIClientError(Exception):
     def __init__(self, method, url, status_code, error):
         self.method = method
@@ -102,6 +131,13 @@ class APIClient:
     Requests will be retried up to `n_retries` times with exponential backoff.
     The backoff is applied after the second attempt and its length is determined
     by following equation `retry_backoff_factor * (2 ** (nth_attempt - 1)) + random_jitter`.
+
+    With `http2=True`, concurrent requests (e.g. pages fetched by fetch_all) are multiplexed
+    over a single connection. It requires the optional `http2` extra which installs `h2`.
+
+    A custom `transport` (any httpx.AsyncBaseTransport, e.g. a tuned httpx.AsyncHTTPTransport
+    or one backed by another HTTP library) replaces the default connection pool, `http2` and
+    the connection limits then have to be configured on the transport itself.
     """
 
     def __init__(
@@ -115,6 +151,8 @@ class APIClient:
         retry_backoff_factor: float = 1.0,
         retry_max_jitter: float = 1.0,
         max_in_flight_requests: int = 4,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         if token is None and (username is None and password is None):
             raise TypeError(
@@ -125,12 +163,36 @@ class APIClient:
         self.username = username
         self.password = password
         self.token = token
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            verify=_default_ssl_context(http2),
+            http2=http2,
+            # Same connection limits as httpx defaults, only the keep-alive expiry is extended
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_EXPIRY_S,
+            ),
+            transport=transport,
+        )
         self.n_retries = n_retries
         self.retry_backoff_factor = retry_backoff_factor
         self.retry_max_jitter = retry_max_jitter
         self.max_in_flight_requests = max_in_flight_requests
 
+    async def __aenter__(self) -> APIClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool.
+
+        The client can be used as an async context manager to close the pool automatically.
+        """
+        await self.client.aclose()
+
     @property
     def _headers(self):
         return {"Authorization": f"token {self.token}"}
@@ -146,6 +208,37 @@ class APIClient:
         """
         return await self.request_json("GET", f"{resource.value}/{id_}", params=request_params)
 
+    async def fetch_many(
+        self,
+        resource: Resource,
+        ids: Iterable[Union[int, str]],
+        batch_size: int = 100,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Retrieve multiple objects in a specific resource by their IDs.
+
+        IDs are passed to the list endpoint as a comma-separated `id` filter, so N objects are
+        retrieved in ceil(N / batch_size) requests instead of N calls of fetch_one. Objects are
+        yielded in the order returned by the API, IDs that do not exist are silently skipped.
+
+        Arguments
+        ---------
+        resource
+            name of the resource provided by Elis API
+        ids
+            IDs of the objects to retrieve
+        batch_size
+            maximum number of IDs sent in a single request, keep it at most the page size to
+            fetch each batch in one round-trip
+        filters
+            mapping from resource field to value used to filter records
+        """
+        id_list = [str(id_) for id_ in ids]
+        for start in range(0, len(id_list), batch_size):
+            batch = ",".join(id_list[start : start + batch_size])
+            async for result in self.fetch_all(resource, id=batch, **filters):
+                yield result
+
     async def fetch_all(
         self,
         resource: Resource,
@@ -159,6 +252,8 @@ class APIClient:
     ) -> AsyncIterator[Dict[str, Any]]:
         """Retrieve a list of objects in a specific resource.
 
+        Pages are fetched concurrently, see fetch_all_by_url.
+
         Arguments
         ---------
         resource
@@ -206,6 +301,10 @@ class APIClient:
     ) -> AsyncIterator[Dict[str, Any]]:
         """Retrieve a list of objects from a specified URL.
 
+        The first page tells the total number of pages, the remaining pages are then requested
+        concurrently (at most `max_in_flight_requests` at a time) while the results are still
+        yielded in the order of pages.
+
         Arguments
         ---------
         url
@@ -293,7 +392,7 @@ class APIClient:
         self,
         resource: Resource,
         id_: int,
-        fp: AsyncBufferedReader,
+        fp: Union[bytes, AsyncBufferedReader, BinaryIO],
         filename: str,
         values: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
@@ -302,6 +401,10 @@ class APIClient:
 
         Arguments
         ---------
+            fp
+                file contents as bytes, or a file opened in binary mode either by aiofiles or by
+                the built-in open(), a regular file is read in the default executor so that it
+                does not block the event loop
             filename
                 name that will be used by Elis for the uploaded file
             metadata
@@ -310,7 +413,16 @@ class APIClient:
                 may be used to initialize values of the object created from the uploaded file,
                 semantics is different for each resource
         """
-        files = {"content": (filename, await fp.read(), "application/octet-stream")}
+        if isinstance(fp, bytes):
+            content = fp
+        elif inspect.iscoroutinefunction(fp.read):
+            content = await typing.cast("AsyncBufferedReader", fp).read()
+        else:
+            # httpx would read a regular file-like object on the event loop, chunk by chunk
+            content = await asyncio.get_running_loop().run_in_executor(
+                None, typing.cast("BinaryIO", fp).read
+            )
+        files = {"content": (filename, content, "application/octet-stream")}
 
         # Filename of values and metadata must be "", otherwise Elis API returns HTTP 400 with body
         # "Value must be valid JSON."
@@ -370,6 +482,18 @@ class APIClient:
             await self._authenticate()
         return self.token  # type: ignore[return-value] # self.token is set in _authenticate method
 
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API before the first real request is sent.
+
+        DNS lookup, TCP + TLS handshake and authentication are done here, so the following
+        requests reuse a ready connection. The login request serves this purpose if there is no
+        token yet, otherwise a HEAD request to the base URL is sent and its status is ignored.
+        """
+        if self.token is None:
+            await self._authenticate()
+        else:
+            await self.client.head(self.base_url, headers=self._headers)
+
     async def _authenticate(self) -> None:
         async for attempt in self._retrying():
             with attempt:
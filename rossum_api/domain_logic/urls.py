@@ -11,7 +11,10 @@ DEFAULT_BASE_URL = "https://elis.rossum.ai/api/v1"
 
 def parse_resource_id_from_url(url: str) -> int:
     # Annotation content resource is special, we need to strip /content suffix
-    return int(url.replace("/content", "").split("/")[-1])
+    if url.endswith("/content"):
+        url = url[: -len("/content")]
+    # Slice after the last slash, no need to split the whole URL into a list
+    return int(url[url.rfind("/") + 1 :])
 
 
 def parse_annotation_id_from_datapoint_url(url: str) -> int:
@@ -2,20 +2,30 @@ from __future__ import annotations
 
 import asyncio
 import json
+import pathlib
 import typing
 from enum import Enum
 
-import aiofiles
-
 from rossum_api.api_client import APIClient
 from rossum_api.domain_logic.resources import Resource
-from rossum_api.domain_logic.urls import DEFAULT_BASE_URL
+from rossum_api.domain_logic.urls import DEFAULT_BASE_URL, parse_resource_id_from_url
 from rossum_api.models import deserialize_default
 from rossum_api.models.task import TaskStatus
 
 if typing.TYPE_CHECKING:
-    import pathlib
-    from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+    from typing import (
+        Any,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Dict,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+        TypeVar,
+        Union,
+    )
 
     import httpx
 
@@ -36,6 +46,20 @@ if typing.TYPE_CHECKING:
     from rossum_api.models.user import User
     from rossum_api.models.workspace import Workspace
 
+    T = TypeVar("T")
+
+
+async def _read_content(file: Union[str, pathlib.Path, bytes]) -> bytes:
+    """Read a file to be uploaded without blocking the event loop.
+
+    A path is read in the default executor, file contents given as bytes are used as they are.
+    The whole file is held in memory: httpx reads multipart file fields synchronously, so
+    streaming the file from disk would block the event loop for every chunk.
+    """
+    if isinstance(file, bytes):
+        return file
+    return await asyncio.get_running_loop().run_in_executor(None, pathlib.Path(file).read_bytes)
+
 
 class ExportFileFormats(Enum):
     CSV = "csv"
@@ -96,9 +120,10 @@ class ElisAPIClient:
     async def import_document(
         self,
         queue_id: int,
-        files: Sequence[Tuple[Union[str, pathlib.Path], str]],
+        files: Sequence[Tuple[Union[str, pathlib.Path, bytes], str]],
         values: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        max_in_flight_uploads: int = 8,
     ) -> List[int]:
         """https://elis.rossum.ai/api/docs/#import-a-document.
 
@@ -109,42 +134,70 @@ class ElisAPIClient:
         queue_id
             ID of the queue to upload the files to
         files
-            2-tuple containing current filepath and name to be used by Elis for the uploaded file
+            2-tuple containing current filepath (or file contents as bytes) and name to be used by
+            Elis for the uploaded file
         metadata
             metadata will be set to newly created annotation object
         values
             may be used to initialize datapoint values by setting the value of rir_field_names in the schema
+        max_in_flight_uploads
+            maximum number of files uploaded at the same time, the rest waits for a free slot
 
         Returns
         -------
         annotation_ids
             list of IDs of created annotations, respects the order of `files` argument
         """
-        tasks = [
-            asyncio.create_task(self._upload(file, queue_id, filename, values, metadata))
-            for file, filename in files
-        ]
-
-        return await asyncio.gather(*tasks)
+        return await self._upload_files(
+            lambda file, filename: self._upload(file, queue_id, filename, values, metadata),
+            files,
+            max_in_flight_uploads,
+        )
 
     async def _upload(self, file, queue_id, filename, values, metadata) -> int:
         """A helper method used for the import document endpoint.
 
         This does not create an Upload object."""
-        async with aiofiles.open(file, "rb") as fp:
-            results = await self._http_client.upload(
-                Resource.Queue, queue_id, fp, filename, values, metadata
+        content = await _read_content(file)
+        results = await self._http_client.upload(
+            Resource.Queue, queue_id, content, filename, values, metadata
+        )
+        (result,) = results["results"]  # We're uploading 1 file in 1 request, we can unpack
+        return parse_resource_id_from_url(result["annotation"])
+
+    async def _upload_files(
+        self,
+        upload: Callable[[Union[str, pathlib.Path, bytes], str], Awaitable[T]],
+        files: Sequence[Tuple[Union[str, pathlib.Path, bytes], str]],
+        max_in_flight_uploads: int,
+    ) -> List[T]:
+        """Call ``upload(file, filename)`` for all files, at most ``max_in_flight_uploads`` at once.
+
+        The results respect the order of `files`."""
+        if max_in_flight_uploads < 1:
+            raise ValueError(
+                f'"max_in_flight_uploads" must be at least 1, got {max_in_flight_uploads}'
             )
-            (result,) = results["results"]  # We're uploading 1 file in 1 request, we can unpack
-            return int(result["annotation"].split("/")[-1])
+        in_flight_guard = asyncio.Semaphore(max_in_flight_uploads)
+
+        async def upload_when_slot_free(file, filename):
+            async with in_flight_guard:
+                return await upload(file, filename)
+
+        return list(
+            await asyncio.gather(
+                *(upload_when_slot_free(file, filename) for file, filename in files)
+            )
+        )
 
     # ##### UPLOAD #####
     async def upload_document(
         self,
         queue_id: int,
-        files: Sequence[Tuple[Union[str, pathlib.Path], str]],
+        files: Sequence[Tuple[Union[str, pathlib.Path, bytes], str]],
         values: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        max_in_flight_uploads: int = 8,
     ) -> List[Task]:
         """https://elis.rossum.ai/api/docs/#create-upload.
 
@@ -153,11 +206,14 @@ class ElisAPIClient:
         queue_id
             ID of the queue to upload the files to
         files
-            2-tuple containing current filepath and name to be used by Elis for the uploaded file
+            2-tuple containing current filepath (or file contents as bytes) and name to be used by
+            Elis for the uploaded file
         metadata
             metadata will be set to newly created annotation object
         values
             may be used to initialize datapoint values by setting the value of rir_field_names in the schema
+        max_in_flight_uploads
+            maximum number of files uploaded at the same time, the rest waits for a free slot
 
         Returns
         -------
@@ -166,16 +222,15 @@ class ElisAPIClient:
             Tasks can be polled using poll_task and if succeeded, will contain a
             link to an Upload object that contains info on uploaded documents/annotations
         """
-        tasks: list[typing.Awaitable[Task]] = [
-            asyncio.create_task(self._create_upload(file, queue_id, filename, values, metadata))
-            for file, filename in files
-        ]
-
-        return list(await asyncio.gather(*tasks))
+        return await self._upload_files(
+            lambda file, filename: self._create_upload(file, queue_id, filename, values, metadata),
+            files,
+            max_in_flight_uploads,
+        )
 
     async def _create_upload(
         self,
-        file: Union[str, pathlib.Path],
+        file: Union[str, pathlib.Path, bytes],
         queue_id: int,
         filename: str,
         values: Optional[Dict[str, Any]] = None,
@@ -184,20 +239,18 @@ class ElisAPIClient:
         """Helper method that uploads the files and gets back Task response for each.
 
         A successful Task will create an Upload object."""
+        url = f"uploads?queue={queue_id}"
+        files = {"content": (filename, await _read_content(file), "application/octet-stream")}
 
-        async with aiofiles.open(file, "rb") as fp:
-            url = f"uploads?queue={queue_id}"
-            files = {"content": (filename, await fp.read(), "application/octet-stream")}
+        if values is not None:
+            files["values"] = ("", json.dumps(values).encode("utf-8"), "application/json")
+        if metadata is not None:
+            files["metadata"] = ("", json.dumps(metadata).encode("utf-8"), "application/json")
 
-            if values is not None:
-                files["values"] = ("", json.dumps(values).encode("utf-8"), "application/json")
-            if metadata is not None:
-                files["metadata"] = ("", json.dumps(metadata).encode("utf-8"), "application/json")
+        task_url = await self.request_json("POST", url, files=files)
+        task_id = parse_resource_id_from_url(task_url["url"])
 
-            task_url = await self.request_json("POST", url, files=files)
-            task_id = task_url["url"].split("/")[-1]
-
-            return await self.retrieve_task(task_id)
+        return await self.retrieve_task(task_id)
 
     async def retrieve_upload(self, upload_id: int) -> Upload:
         """Implements https://elis.rossum.ai/api/docs/#retrieve-upload."""
@@ -244,7 +297,7 @@ class ElisAPIClient:
     async def retrieve_own_organization(self) -> Organization:
         """Retrieve organization of currently logged in user."""
         user: Dict[Any, Any] = await self._http_client.fetch_one(Resource.Auth, "user")
-        organization_id = user["organization"].split("/")[-1]
+        organization_id = parse_resource_id_from_url(user["organization"])
         return await self.retrieve_organization(organization_id)
 
     # ##### SCHEMAS #####
@@ -679,6 +732,10 @@ class ElisAPIClient:
         """
         return await self._http_client.get_token(refresh)
 
+    async def warmup(self) -> None:
+        """Open a connection and authenticate ahead of the first request, see APIClient.warmup."""
+        await self._http_client.warmup()
+
     async def _sideload(self, resource: Dict[str, Any], sideloads: Sequence[str]) -> None:
         """The API does not support sideloading when fetching a single resource, we need to load
         it manually.
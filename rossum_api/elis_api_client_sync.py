@@ -144,9 +144,10 @@ class ElisAPIClientSync:
     def import_document(
         self,
         queue_id: int,
-        files: Sequence[Tuple[Union[str, pathlib.Path], str]],
+        files: Sequence[Tuple[Union[str, pathlib.Path, bytes], str]],
         values: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        max_in_flight_uploads: int = 8,
     ) -> List[int]:
         """https://elis.rossum.ai/api/docs/#import-a-document.
 
@@ -155,11 +156,14 @@ class ElisAPIClientSync:
         Parameters
         ---------
         files
-            2-tuple containing current filepath and name to be used by Elis for the uploaded file
+            2-tuple containing current filepath (or file contents as bytes) and name to be used by
+            Elis for the uploaded file
         metadata
             metadata will be set to newly created annotation object
         values
             may be used to initialize datapoint values by setting the value of rir_field_names in the schema
+        max_in_flight_uploads
+            maximum number of files uploaded at the same time, the rest waits for a free slot
 
         Returns
         -------
@@ -167,16 +171,19 @@ class ElisAPIClientSync:
             list of IDs of created annotations, respects the order of `files` argument
         """
         return self._run_coroutine(
-            self.elis_api_client.import_document(queue_id, files, values, metadata)
+            self.elis_api_client.import_document(
+                queue_id, files, values, metadata, max_in_flight_uploads
+            )
         )
 
     # ##### UPLOAD #####
     def upload_document(
         self,
         queue_id: int,
-        files: Sequence[Tuple[Union[str, pathlib.Path], str]],
+        files: Sequence[Tuple[Union[str, pathlib.Path, bytes], str]],
         values: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        max_in_flight_uploads: int = 8,
     ) -> List[Task]:
         """https://elis.rossum.ai/api/docs/#create-upload.
 
@@ -185,11 +192,14 @@ class ElisAPIClientSync:
         queue_id
             ID of the queue to upload the files to
         files
-            2-tuple containing current filepath and name to be used by Elis for the uploaded file
+            2-tuple containing current filepath (or file contents as bytes) and name to be used by
+            Elis for the uploaded file
         metadata
             metadata will be set to newly created annotation object
         values
             may be used to initialize datapoint values by setting the value of rir_field_names in the schema
+        max_in_flight_uploads
+            maximum number of files uploaded at the same time, the rest waits for a free slot
 
         Returns
         -------
@@ -199,7 +209,9 @@ class ElisAPIClientSync:
             link to an Upload object that contains info on uploaded documents/annotations
         """
         return self._run_coroutine(
-            self.elis_api_client.upload_document(queue_id, files, values, metadata)
+            self.elis_api_client.upload_document(
+                queue_id, files, values, metadata, max_in_flight_uploads
+            )
         )
 
     def retrieve_upload(self, upload_id: int) -> Upload:
@@ -555,3 +567,7 @@ class ElisAPIClientSync:
             force refreshing the token
         """
         return self._run_coroutine(self.elis_api_client.get_token(refresh))
+
+    def warmup(self) -> None:
+        """Open a connection and authenticate ahead of the first request, see APIClient.warmup."""
+        return self._run_coroutine(self.elis_api_client.warmup())
@@ -28,6 +28,28 @@ if TYPE_CHECKING:
     JsonDict = Dict[str, Any]
     Deserializer = Callable[[Resource, JsonDict], Any]
 
+__all__ = (
+    "Annotation",
+    "Connector",
+    "Document",
+    "EmailTemplate",
+    "Engine",
+    "EngineField",
+    "Group",
+    "Hook",
+    "Inbox",
+    "Organization",
+    "Queue",
+    "RESOURCE_TO_MODEL",
+    "Resource",
+    "Schema",
+    "Task",
+    "Upload",
+    "User",
+    "Workspace",
+    "deserialize_default",
+)
+
 
 RESOURCE_TO_MODEL = {
     Resource.Annotation: Annotation,
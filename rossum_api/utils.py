@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-import inflect
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import inflect
+
+
+@functools.lru_cache(maxsize=None)
+def _inflect_engine() -> inflect.engine:
+    # inflect takes seconds to import, so it is only loaded once a sideload needs it
+    import inflect
+
+    return inflect.engine()
 
 
 def to_singular(word: str) -> str:
     """Convert plural form of a word to singular."""
-    engine = inflect.engine()
-    singular_form = engine.singular_noun(word)
+    singular_form = _inflect_engine().singular_noun(word)
     return singular_form or word
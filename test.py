@@ -9,14 +9,16 @@ import logging
 import os
 import random
 
-import aiofiles
-
 from rossum_api import ElisAPIClient, ElisAPIClientSync
 from rossum_api.api_client import APIClient
 
 logging.basicConfig()
 logging.getLogger().setLevel(logging.DEBUG)
 
+BASE_URL = "https://elis.develop.r8.lol/api/v1"
+# Read once, every client variant below is created with the same credentials
+CREDENTIALS = (os.environ["ELIS_USERNAME"], os.environ["ELIS_PASSWORD"])
+
 WORKSPACE = {
     "name": "Rossum Client NG Test",
     "organization": "https://elis.develop.r8.lol/api/v1/organizations/167",
@@ -48,74 +50,80 @@ SCHEMA = {
     "metadata": {},
 }
 
+# Read the sample document once, every upload then reuses the same bytes
+with open("tests/data/sample_invoice.pdf", "rb") as f:
+    SAMPLE_PDF = f.read()
+
+
+def make_client(client_class):
+    return client_class(*CREDENTIALS, base_url=BASE_URL)
+
+
+async def collect(async_iterator):
+    return [item async for item in async_iterator]
+
 
 async def main():
-    client = APIClient(
-        os.environ["ELIS_USERNAME"],
-        os.environ["ELIS_PASSWORD"],
-        base_url="https://elis.develop.r8.lol/api/v1",
-    )
-    workspace = await client.create("workspaces", data=WORKSPACE)
-    response = await client.fetch_one("workspaces", id_=workspace["id"])
-    print("GET result:", response)
-    print("LIST results:")
-    async for w in client.fetch_all("workspaces", ordering=["-id"], name=WORKSPACE["name"]):
-        print(w)
-    response = await client.replace(
-        "workspaces",
-        id_=workspace["id"],
-        data={**WORKSPACE, "name": WORKSPACE["name"]},
-    )
-    print("PUT result:", response)
-    response = await client.update(
-        "workspaces",
-        id_=workspace["id"],
-        data={"name": f"{WORKSPACE['name']} {random.randint(1, 100)}"},
-    )
-    print("PATCH result:", response)
-
-    # Upload a document -- schema and queue must be created to do that
-    schema = await client.create("schemas", data=SCHEMA)
-    queue = await client.create(
-        "queues",
-        data={
-            "workspace": workspace["url"],
-            "name": "Rossum Client NG Test",
-            "schema": schema["url"],
-        },
-    )
+    async with make_client(APIClient) as client:
+        await client.warmup()
+
+        # Build the request payloads up front, outside of the awaited calls
+        put_payload = {**WORKSPACE, "name": WORKSPACE["name"]}
+        patch_payload = {"name": f"{WORKSPACE['name']} {random.randint(1, 100)}"}
+
+        workspace = await client.create("workspaces", data=WORKSPACE)
+        # GET and LIST do not depend on each other, fire them concurrently
+        response, workspaces = await asyncio.gather(
+            client.fetch_one("workspaces", id_=workspace["id"]),
+            collect(client.fetch_all("workspaces", ordering=["-id"], name=WORKSPACE["name"])),
+        )
+        print("GET result:", response)
+        print("LIST results:")
+        for w in workspaces:
+            print(w)
+        response = await client.replace("workspaces", id_=workspace["id"], data=put_payload)
+        print("PUT result:", response)
+        response = await client.update("workspaces", id_=workspace["id"], data=patch_payload)
+        print("PATCH result:", response)
+
+        # Upload a document -- schema and queue must be created to do that
+        schema = await client.create("schemas", data=SCHEMA)
+        queue = await client.create(
+            "queues",
+            data={
+                "workspace": workspace["url"],
+                "name": "Rossum Client NG Test",
+                "schema": schema["url"],
+            },
+        )
 
-    async with aiofiles.open("tests/data/sample_invoice.pdf", "rb") as fp:
         response = await client.upload(
             "queues",
             id_=queue["id"],
-            fp=fp,
+            fp=SAMPLE_PDF,
             filename="filename.pdf",
             values={"upload:organization_unit": "Sales"},
             metadata={"project": "Market ABC"},
         )
         print("UPLOAD result:", response)
 
-    print("EXPORT result:")
-    async for chunk in client.export(
-        "queues",
-        id_=queue["id"],
-        export_format="xml",
-        page_size=200,
-        columns=["meta_file_name", "document_id", "status"],
-    ):
-        print(chunk)
+        print("EXPORT result:")
+        async for chunk in client.export(
+            "queues",
+            id_=queue["id"],
+            export_format="xml",
+            page_size=200,
+            columns=["meta_file_name", "document_id", "status"],
+        ):
+            print(chunk)
 
-    response = await client.delete("workspaces", id_=workspace["id"])
-    print(f"Workspace {workspace['id']} deleted.")
+        response = await client.delete("workspaces", id_=workspace["id"])
+        print(f"Workspace {workspace['id']} deleted.")
 
 
 async def main_with_async_client():
-    client = ElisAPIClient(
-        os.environ["ELIS_USERNAME"],
-        os.environ["ELIS_PASSWORD"],
-        base_url="https://elis.develop.r8.lol/api/v1",
-    )
+    client = make_client(ElisAPIClient)
+    await client.warmup()
     workspace = await client.create_new_workspace(data=WORKSPACE)
     workspace = await client.retrieve_workspace(workspace.id)
     print("GET result:", workspace)
@@ -145,11 +153,8 @@ async def main_with_async_client():
 
 
 def main_with_sync_client():
-    client = ElisAPIClientSync(
-        os.environ["ELIS_USERNAME"],
-        os.environ["ELIS_PASSWORD"],
-        base_url="https://elis.develop.r8.lol/api/v1",
-    )
+    client = make_client(ElisAPIClientSync)
+    client.warmup()
     ws = client.create_new_workspace(data=WORKSPACE)
     workspace_id = ws.id
     ws = client.retrieve_workspace(workspace_id)
@@ -161,6 +166,19 @@ def main_with_sync_client():
     print(f"Workspace {workspace_id} deleted.")
 
 
-asyncio.run(main())
-# asyncio.run(main_with_async_client())
+try:
+    import uvloop
+except ImportError:  # uvloop is optional, the default loop works too
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Run the async variants on one shared loop instead of building a new one per asyncio.run()
+loop = asyncio.new_event_loop()
+try:
+    loop.run_until_complete(main())
+    # loop.run_until_complete(main_with_async_client())
+finally:
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
 # main_with_sync_client()
@@ -1,36 +1,52 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple, Union
+from unittest.mock import Mock
 
-import aiofiles
 import pytest
-import pytest_asyncio
 
 from rossum_api import ElisAPIClient, ElisAPIClientSync
 from rossum_api.api_client import APIClient
 
-ANNOTATIONS = [  # Most fields are stripped as these are not important for the test
-    {
-        "id": 1111,
-        "document": "https://elis.develop.r8.lol/api/v1/documents/11289",
-        "content": "https://elis.develop.r8.lol/api/v1/annotations/1111/content",
-        "automation_blocker": "https://elis.develop.r8.lol/api/v1/automation_blockers/55",
-    },
-    {
-        "id": 2222,
-        "document": "https://elis.develop.r8.lol/api/v1/documents/11288",
-        "content": "https://elis.develop.r8.lol/api/v1/annotations/2222/content",
-        "automation_blocker": "https://elis.develop.r8.lol/api/v1/automation_blockers/55",
-    },
-    {
-        "id": 3333,
-        "document": "https://elis.develop.r8.lol/api/v1/documents/11287",
-        # URL that targets empty content should be translated to an empty list when sideloading
-        "content": "https://elis.develop.r8.lol/api/v1/annotations/3333/content",
-        # None URL is skipped when sideloading
-        "automation_blocker": None,
-    },
-]
+
+class ClientPair(NamedTuple):
+    """A client under test and the mocked APIClient it talks to, still unpacks as a 2-tuple."""
+
+    client: Union[ElisAPIClient, ElisAPIClientSync]
+    http_client: Mock
+
+
+def make_annotations():
+    """Build a fresh list of annotations that a test is free to modify."""
+    return [  # Most fields are stripped as these are not important for the test
+        {
+            "id": 1111,
+            "document": "https://elis.develop.r8.lol/api/v1/documents/11289",
+            "content": "https://elis.develop.r8.lol/api/v1/annotations/1111/content",
+            "automation_blocker": "https://elis.develop.r8.lol/api/v1/automation_blockers/55",
+        },
+        {
+            "id": 2222,
+            "document": "https://elis.develop.r8.lol/api/v1/documents/11288",
+            "content": "https://elis.develop.r8.lol/api/v1/annotations/2222/content",
+            "automation_blocker": "https://elis.develop.r8.lol/api/v1/automation_blockers/55",
+        },
+        {
+            "id": 3333,
+            "document": "https://elis.develop.r8.lol/api/v1/documents/11287",
+            # URL that targets empty content should be translated to an empty list when sideloading
+            "content": "https://elis.develop.r8.lol/api/v1/annotations/3333/content",
+            # None URL is skipped when sideloading
+            "automation_blocker": None,
+        },
+    ]
+
+
+# Read-only, take the annotations fixture in tests that need to modify them
+ANNOTATIONS = make_annotations()
 
 AUTOMATION_BLOCKERS = [
     {
@@ -72,45 +88,9 @@ CONTENT = [
 ]
 
 
-@pytest.fixture
-def http_client():
-    return MagicMock(APIClient)
-
-
-@pytest_asyncio.fixture
-def elis_client(http_client):
-    client = ElisAPIClient(username="", password="", base_url=None, http_client=http_client)
-    return (client, http_client)
-
-
-@pytest.fixture
-def elis_client_sync(http_client):
-    client = ElisAPIClientSync(username="", password="", base_url=None, http_client=http_client)
-    return (client, http_client)
-
-
-@pytest_asyncio.fixture
-async def mock_generator():
-    async def f(item):
-        for i in [item]:
-            yield i
-
-    return f
-
-
-@pytest_asyncio.fixture
-async def mock_file_read():
-    async def f(path):
-        async with aiofiles.open(path, "rb") as fp:
-            async for line in fp:
-                yield line
-
-    return f
-
-
-@pytest.fixture
-def dummy_user():
-    return {
+# Mapping proxies keep the shared payloads read-only, so tests can reuse them without copying
+DUMMY_USER = MappingProxyType(
+    {
         "id": 10775,
         "url": "https://elis.rossum.ai/api/v1/users/10775",
         "first_name": "John",
@@ -127,11 +107,10 @@ def dummy_user():
         "metadata": {},
         "oidc_id": None,
     }
+)
 
-
-@pytest.fixture
-def dummy_queue():
-    return {
+DUMMY_QUEUE = MappingProxyType(
+    {
         "id": 8198,
         "name": "Received invoices",
         "url": "https://elis.rossum.ai/api/v1/queues/8198",
@@ -183,3 +162,69 @@ def dummy_queue():
             },
         },
     }
+)
+
+
+@pytest.fixture
+def http_client():
+    return Mock(spec=APIClient)
+
+
+@pytest.fixture
+def elis_client(http_client):
+    client = ElisAPIClient(username="", password="", base_url=None, http_client=http_client)
+    return ClientPair(client, http_client)
+
+
+@pytest.fixture
+def elis_client_sync(http_client):
+    client = ElisAPIClientSync(username="", password="", base_url=None, http_client=http_client)
+    return ClientPair(client, http_client)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make asyncio.sleep return immediately, the requested delays are collected in a list."""
+    sleeps = []
+
+    async def sleep(delay, result=None):
+        sleeps.append(delay)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return sleeps
+
+
+@pytest.fixture
+def mock_generator():
+    async def f(item):
+        yield item
+
+    return f
+
+
+@pytest.fixture
+def mock_file_read():
+    async def f(path):
+        # Read the whole file in one worker call and yield it line by line, iterating the file
+        # itself by lines would dispatch one thread pool job per newline
+        data = await asyncio.get_running_loop().run_in_executor(None, Path(path).read_bytes)
+        for line in data.splitlines(keepends=True):
+            yield line
+
+    return f
+
+
+@pytest.fixture
+def annotations():
+    return make_annotations()
+
+
+@pytest.fixture
+def dummy_user():
+    return DUMMY_USER
+
+
+@pytest.fixture
+def dummy_queue():
+    return DUMMY_QUEUE
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import copy
-
 from conftest import ANNOTATIONS, AUTOMATION_BLOCKERS, CONTENT
 
 from rossum_api.domain_logic.sideloads import build_sideload_params, embed_sideloads
@@ -13,26 +11,32 @@ RESPONSE_DATA = {
     "automation_blockers": AUTOMATION_BLOCKERS,
 }
 
+EXPECTED_SIDELOAD_PARAMS = {
+    "sideload": "content,automation_blockers",
+    "content.schema_id": "sender_id,vat_detail",
+}
+
+EXPECTED_ANNOTATIONS = [
+    {**ANNOTATIONS[0], "content": [CONTENT[1]], "automation_blocker": AUTOMATION_BLOCKERS[0]},
+    {
+        **ANNOTATIONS[1],
+        "content": [CONTENT[0], CONTENT[2]],
+        "automation_blocker": AUTOMATION_BLOCKERS[0],
+    },
+    {**ANNOTATIONS[2], "content": []},
+]
+
 
 def test_build_sideload_params():
-    assert build_sideload_params(
-        ["content", "automation_blockers"], ["sender_id", "vat_detail"]
-    ) == {
-        "sideload": "content,automation_blockers",
-        "content.schema_id": "sender_id,vat_detail",
-    }
+    assert (
+        build_sideload_params(["content", "automation_blockers"], ["sender_id", "vat_detail"])
+        == EXPECTED_SIDELOAD_PARAMS
+    )
 
 
-def test_embed_sideloads():
+def test_embed_sideloads(annotations):
     """Automation blockers and datapoints from content are correctly inserted into results."""
-    response_data = copy.deepcopy(RESPONSE_DATA)
+    response_data = {**RESPONSE_DATA, "results": annotations}
     embed_sideloads(response_data, ["content", "automation_blockers"])
 
-    expected_annotations = copy.deepcopy(ANNOTATIONS)
-    expected_annotations[0]["content"] = [CONTENT[1]]
-    expected_annotations[0]["automation_blocker"] = AUTOMATION_BLOCKERS[0]
-    expected_annotations[1]["content"] = [CONTENT[0], CONTENT[2]]
-    expected_annotations[1]["automation_blocker"] = AUTOMATION_BLOCKERS[0]
-    expected_annotations[2]["content"] = []
-
-    assert response_data["results"] == expected_annotations
+    assert response_data["results"] == EXPECTED_ANNOTATIONS
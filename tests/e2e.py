@@ -10,130 +10,176 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import pathlib
+import tempfile
+import uuid
 from typing import TYPE_CHECKING
 
-import aiofiles
 import pytest
-from aiofiles import os as aios
+import pytest_asyncio
 
 from rossum_api import ElisAPIClient
 from rossum_api.domain_logic.resources import Resource
+from rossum_api.domain_logic.urls import parse_resource_id_from_url
 
 if TYPE_CHECKING:
-    from typing import Optional
+    from typing import AsyncIterator, BinaryIO
 
-    from rossum_api.models.queue import Queue
-    from rossum_api.models.schema import Schema
-    from rossum_api.models.workspace import Workspace
+# Every test and async fixture in this module runs in the one session-scoped event loop, the
+# loop the shared client's connection pool is bound to
+pytestmark = pytest.mark.asyncio(scope="session")
 
 logging.basicConfig()
 logging.getLogger().setLevel(logging.DEBUG)
 
+EXPORT_BUFFER_SIZE = 1 << 20  # 1 MiB
+N_DOCS = 2  # documents uploaded by each test
+MAX_IN_FLIGHT_POLLS = 8  # keep polling of many uploads from flooding the API with requests
+
 WORKSPACE = {
     "name": "Rossum Client NG Test",
     "organization": os.environ["ROSSUM_ORGANIZATION_URL"],
 }
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    # One client, and so one connection pool, is shared by all tests
+    client = ElisAPIClient(
+        token=os.environ["ROSSUM_TOKEN"],
+        base_url=os.environ["ROSSUM_BASE_URL"],
+    )
+    yield client
+    await client._http_client.aclose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def workspace_and_schema(client):
+    # Workspace and schema do not depend on each other, create and delete them concurrently
+    workspace, schema = await asyncio.gather(
+        client.create_new_workspace(data=WORKSPACE),
+        client.create_new_schema({"name": "E2E Test Schema", "content": []}),
+        return_exceptions=True,
+    )
+    try:
+        for result in (workspace, schema):
+            if isinstance(result, BaseException):
+                raise result
+        yield workspace, schema
+    finally:
+        # Delete whatever got created, even if creating the other one failed
+        deletions = []
+        if not isinstance(workspace, BaseException):
+            deletions.append(client.delete_workspace(workspace.id))
+        if not isinstance(schema, BaseException):
+            deletions.append(client.delete_schema(schema.id))
+        await asyncio.gather(*deletions)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def queue(client, workspace_and_schema):
+    workspace, schema = workspace_and_schema
+    queue = await client.create_new_queue(
+        data={"name": "Run 1", "workspace": workspace.url, "schema": schema.url}
+    )
+    yield queue
+    await client.delete_queue(queue.id)
+
+
+@pytest.fixture(scope="session")
+def sample_invoice():
+    # Read once and uploaded from memory by every test
+    return pathlib.Path("tests/data/sample_invoice.pdf").read_bytes()
+
+
+def unique_file_names(count: int = N_DOCS) -> tuple[str, ...]:
+    """Name documents uniquely per test, so tests sharing the queue can tell theirs apart."""
+    prefix = uuid.uuid4().hex
+    return tuple(f"e2etest_{prefix}_doc_{i}.pdf" for i in range(count))
+
+
+async def write_chunks(chunks: AsyncIterator[bytes], f: BinaryIO) -> None:
+    """Write streamed chunks to a file in EXPORT_BUFFER_SIZE batches from a worker thread.
+
+    The small HTTP chunks are copied into one preallocated buffer, which is handed to the worker
+    thread whenever it fills up, so a large export neither needs a write per chunk nor
+    allocates a new batch buffer each time.
+    """
+    loop = asyncio.get_running_loop()
+    buffer = memoryview(bytearray(EXPORT_BUFFER_SIZE))
+    filled = 0
+    async for chunk in chunks:
+        chunk_view = memoryview(chunk)
+        while chunk_view:
+            n = min(len(chunk_view), EXPORT_BUFFER_SIZE - filled)
+            buffer[filled : filled + n] = chunk_view[:n]
+            filled += n
+            chunk_view = chunk_view[n:]
+            if filled == EXPORT_BUFFER_SIZE:
+                await loop.run_in_executor(None, f.write, buffer)
+                filled = 0
+    await loop.run_in_executor(None, write_and_flush, f, buffer[:filled])
+
+
+def write_and_flush(f: BinaryIO, data: memoryview) -> None:
+    f.write(data)
+    f.flush()
+
+
+async def import_document_flow(client, queue, files, file_names):
+    # All files are submitted concurrently, one annotation is created for each of them
+    annotation_ids = await client.import_document(queue.id, files)
+    assert len(annotation_ids) == len(files)
+    exported_file_names = {
+        annotation.document["file_name"]
+        async for annotation in client.export_annotations_to_json(queue.id)
+    }
+    # The queue is shared with other tests, other documents may be exported as well
+    assert file_names <= exported_file_names
+
+    with tempfile.NamedTemporaryFile("wb") as f:
+        await write_chunks(client.export_annotations_to_file(queue.id, "xml"), f)
+        assert os.stat(f.name).st_size > 0
+
+
+async def create_upload_flow(client, queue, files, file_names):
+    """An idea for potential E2E test for https://elis.rossum.ai/api/docs/#create-upload."""
+    tasks = await client.upload_document(queue.id, files)
+    in_flight_guard = asyncio.Semaphore(MAX_IN_FLIGHT_POLLS)
+
+    async def retrieve_document(task):
+        async with in_flight_guard:
+            return await _retrieve_document(task)
+
+    async def _retrieve_document(task):
+        task = await client.poll_task_until_succeeded(task.id)
+        upload_url = task.result_url
+        upload_id = parse_resource_id_from_url(upload_url)
+        upload = await client.retrieve_upload(upload_id)
+        annotation_id = [parse_resource_id_from_url(a) for a in upload.annotations]
+        annotation = await client.poll_annotation_until_imported(annotation_id[0])
+        document_id = parse_resource_id_from_url(annotation.document)
+        document_response = await client._http_client.fetch_one(Resource.Document, document_id)
+        return client._deserializer(Resource.Document, document_response)
+
+    # Polling is mostly waiting, follow all uploads at once instead of one after another
+    documents = await asyncio.gather(*(retrieve_document(task) for task in tasks))
+
+    for document in documents:
+        assert document.original_file_name in file_names
+
+
 class TestE2E:
-    async def test_import_document(self):
-        workspace: Optional[Workspace] = None
-        queue: Optional[Queue] = None
-        schema: Optional[Schema] = None
-
-        client = ElisAPIClient(
-            token=os.environ["ROSSUM_TOKEN"],
-            base_url=os.environ["ROSSUM_BASE_URL"],
-        )
-        try:
-            workspace = await client.create_new_workspace(data=WORKSPACE)
-            schema = await client.create_new_schema({"name": "E2E Test Schema", "content": []})
-
-            queue_data = {
-                "name": "Run 1",
-                "workspace": workspace.url,
-                "schema": schema.url,
-            }
-            queue = await client.create_new_queue(data=queue_data)
-
-            files = {("./tests/data/sample_invoice.pdf", f"e2etest_doc_{i}.pdf") for i in range(2)}
-
-            await client.import_document(queue.id, files)
-            async for annotation in client.export_annotations_to_json(queue.id):
-                assert annotation.document["file_name"] in [
-                    f"e2etest_doc_{i}.pdf" for i in range(2)
-                ]
-
-            async with aiofiles.tempfile.TemporaryFile("wb") as f:
-                tempfile_name = f.name
-                async for chunk in client.export_annotations_to_file(queue.id, "xml"):
-                    await f.write(chunk)
-
-                await f.flush()
-                assert (await aios.stat(tempfile_name)).st_size > 0
-        finally:
-            # cleanup of created entities
-            if queue:
-                await client.delete_queue(queue.id)
-            if schema:
-                await client.delete_schema(schema.id)
-            if workspace:
-                await client.delete_workspace(workspace.id)
-
-    async def test_create_upload(self):
-        """An idea for potential E2E test for https://elis.rossum.ai/api/docs/#create-upload."""
-        workspace: Optional[Workspace] = None
-        queue: Optional[Queue] = None
-        schema: Optional[Schema] = None
-
-        client = ElisAPIClient(
-            token=os.environ["ROSSUM_TOKEN"],
-            base_url=os.environ["ROSSUM_BASE_URL"],
-        )
-        try:
-            workspace = await client.create_new_workspace(data=WORKSPACE)
-            schema = await client.create_new_schema({"name": "E2E Test Schema", "content": []})
-
-            queue_data = {
-                "name": "Run 1",
-                "workspace": workspace.url,
-                "schema": schema.url,
-            }
-            queue = await client.create_new_queue(data=queue_data)
-
-            files = {("./tests/data/sample_invoice.pdf", f"e2etest_doc_{i}.pdf") for i in range(2)}
-
-            tasks = await client.upload_document(queue.id, files)
-
-            annotations = []
-
-            for task in tasks:
-                task_id = task.id
-                task = await client.poll_task_until_succeeded(task_id)
-                upload_url = task.result_url
-                upload_id = int(upload_url.split("/")[-1])
-                upload = await client.retrieve_upload(upload_id)
-                annotation_id = [int(a.split("/")[-1]) for a in upload.annotations]
-                annotation = await client.poll_annotation_until_imported(annotation_id[0])
-                annotations.append(annotation)
-
-            for annotation in annotations:
-                document_id = int(annotation.document.split("/")[-1])
-                document_response = await client._http_client.fetch_one(
-                    Resource.Document, document_id
-                )
-                document = client._deserializer(Resource.Document, document_response)
-
-                assert document.original_file_name in [f"e2etest_doc_{i}.pdf" for i in range(2)]
-
-        finally:
-            # cleanup of created entities
-            if queue:
-                await client.delete_queue(queue.id)
-            if schema:
-                await client.delete_schema(schema.id)
-            if workspace:
-                await client.delete_workspace(workspace.id)
+    @pytest.mark.parametrize(
+        "flow",
+        [import_document_flow, create_upload_flow],
+        ids=["import_document", "create_upload"],
+    )
+    async def test_document_flow(self, client, queue, sample_invoice, flow):
+        file_names = unique_file_names()
+        # A tuple keeps the upload order deterministic, the frozenset serves the assertions
+        files = tuple((sample_invoice, file_name) for file_name in file_names)
+        await flow(client, queue, files, frozenset(file_names))
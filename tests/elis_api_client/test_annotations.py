@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Iterator
+from unittest.mock import call
 
 import pytest
 
+from rossum_api import ElisAPIClientSync
 from rossum_api.domain_logic.resources import Resource
 from rossum_api.models.annotation import Annotation
 from rossum_api.models.automation_blocker import AutomationBlocker, AutomationBlockerContent
 from rossum_api.models.document import Document
 from rossum_api.models.user import User
 
-
-@pytest.fixture
-def dummy_annotation():
-    return {
+# Mapping proxies keep the shared payloads read-only, so tests can reuse them without copying
+DUMMY_ANNOTATION = MappingProxyType(
+    {
         "document": "https://elis.rossum.ai/api/v1/documents/314628",
         "id": 314528,
         "queue": "https://elis.rossum.ai/api/v1/queues/8199",
@@ -41,27 +43,29 @@ def dummy_annotation():
         "has_email_thread_with_replies": True,
         "has_email_thread_with_new_replies": False,
     }
-
-
-@pytest.fixture
-def dummy_annotation_with_sideloads():
-    return {
-        "document": {
-            "id": 3244308,
-            "url": "https://elis.develop.r8.lol/api/v1/documents/3244308",
-            "s3_name": "7731c4d28b3bf6ae5e29f933798b1393",
-            "parent": None,
-            "email": None,
-            "mime_type": "application/pdf",
-            "creator": "https://elis.develop.r8.lol/api/v1/users/71531",
-            "created_at": "2022-07-12T08:16:41.731996Z",
-            "arrived_at": "2022-07-12T08:16:41.731996Z",
-            "original_file_name": "test_lacte1.pdf",
-            "content": "https://elis.develop.r8.lol/api/v1/documents/3244308/content",
-            "attachment_status": None,
-            "metadata": {},
-            "annotations": ["https://elis.develop.r8.lol/api/v1/annotations/3232238"],
-        },
+)
+
+# The nested sideloads are frozen as well
+DUMMY_ANNOTATION_WITH_SIDELOADS = MappingProxyType(
+    {
+        "document": MappingProxyType(
+            {
+                "id": 3244308,
+                "url": "https://elis.develop.r8.lol/api/v1/documents/3244308",
+                "s3_name": "7731c4d28b3bf6ae5e29f933798b1393",
+                "parent": None,
+                "email": None,
+                "mime_type": "application/pdf",
+                "creator": "https://elis.develop.r8.lol/api/v1/users/71531",
+                "created_at": "2022-07-12T08:16:41.731996Z",
+                "arrived_at": "2022-07-12T08:16:41.731996Z",
+                "original_file_name": "test_lacte1.pdf",
+                "content": "https://elis.develop.r8.lol/api/v1/documents/3244308/content",
+                "attachment_status": None,
+                "metadata": {},
+                "annotations": ["https://elis.develop.r8.lol/api/v1/annotations/3232238"],
+            }
+        ),
         "id": 3232238,
         "queue": "https://elis.develop.r8.lol/api/v1/queues/764624",
         "schema": "https://elis.develop.r8.lol/api/v1/schemas/325761",
@@ -71,25 +75,27 @@ def dummy_annotation_with_sideloads():
             "https://elis.develop.r8.lol/api/v1/pages/3481781",
         ],
         "creator": "https://elis.develop.r8.lol/api/v1/users/71531",
-        "modifier": {
-            "id": 71531,
-            "url": "https://elis.develop.r8.lol/api/v1/users/71531",
-            "first_name": "",
-            "last_name": "",
-            "email": "rir.e2e.tests@rossum.ai",
-            "email_verified": True,
-            "date_joined": "2021-08-02T14:11:41.692653Z",
-            "username": "rir.e2e.tests@rossum.ai",
-            "groups": ["https://elis.develop.r8.lol/api/v1/groups/3"],
-            "organization": "https://elis.develop.r8.lol/api/v1/organizations/40507",
-            "queues": [],
-            "is_active": True,
-            "last_login": "2022-07-13T08:41:35.934997Z",
-            "ui_settings": {},
-            "metadata": {},
-            "oidc_id": None,
-            "auth_type": "password",
-        },
+        "modifier": MappingProxyType(
+            {
+                "id": 71531,
+                "url": "https://elis.develop.r8.lol/api/v1/users/71531",
+                "first_name": "",
+                "last_name": "",
+                "email": "rir.e2e.tests@rossum.ai",
+                "email_verified": True,
+                "date_joined": "2021-08-02T14:11:41.692653Z",
+                "username": "rir.e2e.tests@rossum.ai",
+                "groups": ["https://elis.develop.r8.lol/api/v1/groups/3"],
+                "organization": "https://elis.develop.r8.lol/api/v1/organizations/40507",
+                "queues": [],
+                "is_active": True,
+                "last_login": "2022-07-13T08:41:35.934997Z",
+                "ui_settings": {},
+                "metadata": {},
+                "oidc_id": None,
+                "auth_type": "password",
+            }
+        ),
         "created_at": "2022-07-12T08:16:41.910102Z",
         "modified_at": "2022-07-12T08:17:18.961411Z",
         "confirmed_at": None,
@@ -106,360 +112,295 @@ def dummy_annotation_with_sideloads():
         "suggested_edit": None,
         "related_emails": [],
         "email": None,
-        "automation_blocker": {
-            "id": 981916,
-            "url": "https://elis.develop.r8.lol/api/v1/automation_blockers/981916",
-            "content": [
-                {"type": "automation_disabled", "level": "annotation"},
-                {
-                    "level": "datapoint",
-                    "type": "error_message",
-                    "samples": [
-                        {"details": {"message_content": ["Total Amount is most likely not empty"]}}
-                    ],
-                },
-            ],
-            "annotation": "https://elis.develop.r8.lol/api/v1/annotations/3232238",
-        },
+        "automation_blocker": MappingProxyType(
+            {
+                "id": 981916,
+                "url": "https://elis.develop.r8.lol/api/v1/automation_blockers/981916",
+                "content": [
+                    {"type": "automation_disabled", "level": "annotation"},
+                    {
+                        "level": "datapoint",
+                        "type": "error_message",
+                        "samples": [
+                            {
+                                "details": {
+                                    "message_content": ["Total Amount is most likely not empty"]
+                                }
+                            }
+                        ],
+                    },
+                ],
+                "annotation": "https://elis.develop.r8.lol/api/v1/annotations/3232238",
+            }
+        ),
         "email_thread": None,
         "has_email_thread_with_replies": False,
         "has_email_thread_with_new_replies": False,
         "organization": "https://elis.develop.r8.lol/api/v1/organizations/40507",
     }
-
-
-@pytest.mark.asyncio
-class TestAnnotations:
-    async def test_list_all_annotations(self, elis_client, dummy_annotation, mock_generator):
-        client, http_client = elis_client
-        http_client.fetch_all.return_value = mock_generator(dummy_annotation)
-
-        annotations = client.list_all_annotations()
-
-        async for a in annotations:
-            assert a == Annotation(**dummy_annotation)
-
-        http_client.fetch_all.assert_called_with(Resource.Annotation, (), (), ())
-
-    async def test_list_all_annotations_with_sideloads(
-        self, elis_client, dummy_annotation_with_sideloads, mock_generator
-    ):
-        client, http_client = elis_client
-        http_client.fetch_all.return_value = mock_generator(dummy_annotation_with_sideloads)
-
-        annotations = client.list_all_annotations(
-            sideloads=["documents", "automation_blockers", "content", "modifiers"],
-            content_schema_ids=["325164"],
-        )
-
-        async for a in annotations:
-            annotation = Annotation(**dummy_annotation_with_sideloads)
-            modifier = User(**annotation.modifier)
-            annotation.modifier = modifier
-            automation_blocker = Document(**annotation.document)
-            annotation.document = automation_blocker
-            automation_blocker = AutomationBlocker(**annotation.automation_blocker)
-            automation_blocker.content = [
-                AutomationBlockerContent(**content) for content in automation_blocker.content
-            ]
-            annotation.automation_blocker = automation_blocker
-            annotation.content = [
-                AutomationBlockerContent(**content) for content in annotation.content
-            ]
-            assert a == annotation
-
-        http_client.fetch_all.assert_called_with(
+)
+
+AID = DUMMY_ANNOTATION["id"]
+
+SIDELOADS = ["documents", "automation_blockers", "content", "modifiers"]
+CONTENT_SCHEMA_IDS = ["325164"]
+
+# Response of the content endpoint for an annotation without any content, only ever read
+EMPTY_CONTENT = MappingProxyType({"content": []})
+
+# (client method, its arguments, APIClient method it should call, the expected call to it,
+# whether the client method returns the annotation)
+CRUD_CASES = [
+    pytest.param(
+        "retrieve_annotation",
+        (AID,),
+        "fetch_one",
+        call(Resource.Annotation, AID),
+        True,
+        id="retrieve",
+    ),
+    pytest.param(
+        "start_annotation",
+        (AID,),
+        "request_json",
+        call("POST", f"annotations/{AID}/start"),
+        False,
+        id="start",
+    ),
+    pytest.param(
+        "update_annotation",
+        (
+            AID,
+            {
+                "document": "https://elis.rossum.ai/api/v1/documents/315877",
+                "queue": "https://elis.rossum.ai/api/v1/queues/8236",
+                "status": "postponed",
+            },
+        ),
+        "replace",
+        call(
             Resource.Annotation,
-            (),
-            ["documents", "automation_blockers", "content", "modifiers"],
-            ["325164"],
-        )
-
-    async def test_list_all_annotations_with_content_sideloads_without_schema_ids(
-        self, elis_client
-    ):
-        client, http_client = elis_client
-        http_client.fetch_all = MagicMock()
-
-        with pytest.raises(ValueError):
-            async for _ in client.list_all_annotations(
-                sideloads=["content"],
-            ):
-                pass
-
-        assert not http_client.fetch_all.called
-
-    async def test_search_for_annotations(self, elis_client, dummy_annotation, mock_generator):
-        client, http_client = elis_client
-        http_client.fetch_all.return_value = mock_generator(dummy_annotation)
-
-        annotations = client.search_for_annotations({"$and": []}, {"string": "expl"})
-
-        async for a in annotations:
-            assert a == Annotation(**dummy_annotation)
-
-        http_client.fetch_all_by_url.assert_called_with(
-            "annotations/search",
-            (),
-            (),
-            json={"query": {"$and": []}, "query_string": {"string": "expl"}},
-            method="POST",
-        )
-
-    async def test_retrieve_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.fetch_one.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        annotation = await client.retrieve_annotation(aid)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.fetch_one.assert_called_with(Resource.Annotation, aid)
-
-    async def test_retrieve_annotation_with_sideloads(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.return_value = dummy_annotation.copy()
-        http_client.request_json.return_value = {"content": []}
-
-        aid = dummy_annotation["id"]
-        annotation = await client.retrieve_annotation(aid, sideloads=["content"])
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-
-        http_client.fetch_one.assert_called_with(Resource.Annotation, aid)
-
-    async def test_poll_annotation(self, elis_client, dummy_annotation):
-        def is_imported(annotation):
-            return annotation.status not in ("importing", "created")
-
-        client, http_client = elis_client
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
-        # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy()]
-        # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
-
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = await client.poll_annotation(
-                dummy_annotation["id"], is_imported, sleep_s=2, sideloads=["content"]
-            )
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-
-        sleep_mock.assert_called_once_with(2)
-
-    async def test_poll_annotation_until_imported(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
-        # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy()]
-        # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
-
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = await client.poll_annotation_until_imported(
-                dummy_annotation["id"], sleep_s=2, sideloads=["content"]
-            )
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-        sleep_mock.assert_called_once_with(2)
-
-    async def test_upload_and_wait_until_imported(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
-        # Mock uploading a document
-        http_client.upload.side_effect = [
-            {"results": [{"annotation": f"/annotation/{dummy_annotation['id']}"}]}
-        ]
-        # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy()]
-        # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
-
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = await client.upload_and_wait_until_imported(
-                queue_id=8199,
-                filepath="tests/data/sample_invoice.pdf",
-                filename="document.pdf",
-                sleep_s=2,
-                sideloads=["content"],
-            )
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-
-        sleep_mock.assert_called_once_with(2)
-
-    async def test_start_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.replace.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-
-        await client.start_annotation(aid)
-        http_client.request_json.assert_called_with("POST", f"annotations/{aid}/start")
-
-    async def test_update_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.replace.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        data = {
-            "document": "https://elis.rossum.ai/api/v1/documents/315877",
-            "queue": "https://elis.rossum.ai/api/v1/queues/8236",
-            "status": "postponed",
-        }
-        annotation = await client.update_annotation(aid, data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.replace.assert_called_with(Resource.Annotation, aid, data)
-
-    async def test_update_part_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.update.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        data = {
-            "status": "deleted",
-        }
-        annotation = await client.update_part_annotation(aid, data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.update.assert_called_with(Resource.Annotation, aid, data)
-
-    async def test_bulk_update_annotation_data(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.request_json.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        operations = [{"id": 2510559656, "op": "remove"}, {"id": 2510559657, "op": "remove"}]
-        await client.bulk_update_annotation_data(aid, operations)
+            AID,
+            {
+                "document": "https://elis.rossum.ai/api/v1/documents/315877",
+                "queue": "https://elis.rossum.ai/api/v1/queues/8236",
+                "status": "postponed",
+            },
+        ),
+        True,
+        id="update",
+    ),
+    pytest.param(
+        "update_part_annotation",
+        (AID, {"status": "deleted"}),
+        "update",
+        call(Resource.Annotation, AID, {"status": "deleted"}),
+        True,
+        id="update_part",
+    ),
+    pytest.param(
+        "bulk_update_annotation_data",
+        (AID, [{"id": 2510559656, "op": "remove"}, {"id": 2510559657, "op": "remove"}]),
+        "request_json",
+        call(
+            "POST",
+            f"annotations/{AID}/content/operations",
+            json={
+                "operations": [
+                    {"id": 2510559656, "op": "remove"},
+                    {"id": 2510559657, "op": "remove"},
+                ]
+            },
+        ),
+        False,
+        id="bulk_update_data",
+    ),
+    pytest.param(
+        "confirm_annotation",
+        (AID,),
+        "request_json",
+        call("POST", f"annotations/{AID}/confirm"),
+        False,
+        id="confirm",
+    ),
+    pytest.param(
+        "create_new_annotation",
+        (
+            {
+                "status": "created",
+                "document": DUMMY_ANNOTATION["document"],
+                "queue": DUMMY_ANNOTATION["queue"],
+            },
+        ),
+        "create",
+        call(
+            Resource.Annotation,
+            {
+                "status": "created",
+                "document": DUMMY_ANNOTATION["document"],
+                "queue": DUMMY_ANNOTATION["queue"],
+            },
+        ),
+        True,
+        id="create",
+    ),
+    pytest.param(
+        "delete_annotation",
+        (AID,),
+        "request",
+        call("POST", url=f"annotations/{AID}/delete"),
+        False,
+        id="delete",
+    ),
+    pytest.param(
+        "cancel_annotation",
+        (AID,),
+        "request",
+        call("POST", url=f"annotations/{AID}/cancel"),
+        False,
+        id="cancel",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def dummy_annotation():
+    return DUMMY_ANNOTATION
 
-        http_client.request_json.assert_called_with(
-            "POST", f"annotations/{aid}/content/operations", json={"operations": operations}
-        )
 
-    async def test_confirm_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.replace.return_value = dummy_annotation
+@pytest.fixture(scope="module")
+def dummy_annotation_with_sideloads():
+    return DUMMY_ANNOTATION_WITH_SIDELOADS
 
-        aid = dummy_annotation["id"]
 
-        await client.confirm_annotation(aid)
-        http_client.request_json.assert_called_with("POST", f"annotations/{aid}/confirm")
+@pytest.fixture(scope="module")
+def in_progress_annotation(dummy_annotation):
+    return MappingProxyType({**dummy_annotation, "status": "importing"})
 
-    async def test_create_new_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-        http_client.create.return_value = dummy_annotation
 
-        data = {
-            "status": "created",
-            "document": dummy_annotation["document"],
-            "queue": dummy_annotation["queue"],
+@pytest.fixture
+def dummy_annotation_payload(dummy_annotation):
+    """A writable copy of the annotation as the API returns it.
+
+    Sideloading embeds the sideloaded objects into the fetched payload, the read-only module-wide
+    annotation cannot be handed over to the client for that.
+    """
+    return dict(dummy_annotation)
+
+
+@pytest.fixture(scope="module")
+def expected_annotation(dummy_annotation):
+    return Annotation(**dummy_annotation)
+
+
+@pytest.fixture(scope="module")
+def expected_annotation_content_sideloaded(dummy_annotation):
+    """The annotation after its (empty) content has been sideloaded."""
+    return Annotation(**{**dummy_annotation, "content": []})
+
+
+@pytest.fixture(scope="module")
+def expected_annotation_sideloaded(dummy_annotation_with_sideloads):
+    # Build the sideloaded models first so that each object is constructed exactly once
+    automation_blocker = dummy_annotation_with_sideloads["automation_blocker"]
+    return Annotation(
+        **{
+            **dummy_annotation_with_sideloads,
+            "modifier": User(**dummy_annotation_with_sideloads["modifier"]),
+            "document": Document(**dummy_annotation_with_sideloads["document"]),
+            "automation_blocker": AutomationBlocker(
+                **{
+                    **automation_blocker,
+                    "content": [
+                        AutomationBlockerContent(**content)
+                        for content in automation_blocker["content"]
+                    ],
+                }
+            ),
         }
-        annotation = await client.create_new_annotation(data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.create.assert_called_with(Resource.Annotation, data)
+    )
 
-    async def test_delete_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
-
-        aid = dummy_annotation["id"]
-        await client.delete_annotation(aid)
 
-        http_client.request.assert_called_with(
-            "POST", url=f"{Resource.Annotation.value}/{aid}/delete"
-        )
+@pytest.fixture(params=["elis_client", "elis_client_sync"])
+def any_client(request):
+    """Either client flavour, the sync one runs its coroutines in its own worker thread."""
+    return request.getfixturevalue(request.param)
 
-    async def test_cancel_annotation(self, elis_client, dummy_annotation):
-        client, http_client = elis_client
 
-        aid = dummy_annotation["id"]
-        await client.cancel_annotation(aid)
+async def resolve(client, result):
+    """Bring a result of either client to the same shape.
 
-        http_client.request.assert_called_with(
-            "POST", url=f"{Resource.Annotation.value}/{aid}/cancel"
-        )
+    The async client has to return a coroutine or an async iterator, which is awaited or collected
+    into a list. The sync client has to return the result itself, only iterators are collected.
+    """
+    if isinstance(client, ElisAPIClientSync):
+        assert not isinstance(result, (Awaitable, AsyncIterator))
+        return list(result) if isinstance(result, Iterator) else result
+    if isinstance(result, AsyncIterator):
+        return [item async for item in result]
+    return await result
 
 
-class TestAnnotationsSync:
-    def test_list_all_annotations(self, elis_client_sync, dummy_annotation, mock_generator):
-        client, http_client = elis_client_sync
+@pytest.mark.asyncio
+class TestAnnotations:
+    async def test_list_all_annotations(
+        self, any_client, dummy_annotation, expected_annotation, mock_generator
+    ):
+        client, http_client = any_client
         http_client.fetch_all.return_value = mock_generator(dummy_annotation)
 
-        annotations = client.list_all_annotations()
+        annotations = await resolve(client, client.list_all_annotations())
 
-        for a in annotations:
-            assert a == Annotation(**dummy_annotation)
+        assert annotations == [expected_annotation]
 
-        http_client.fetch_all.assert_called_with(Resource.Annotation, (), (), ())
+        assert http_client.fetch_all.call_args == call(Resource.Annotation, (), (), ())
 
-    def test_list_all_annotations_with_sideloads(
-        self, elis_client_sync, dummy_annotation_with_sideloads, mock_generator
+    async def test_list_all_annotations_with_sideloads(
+        self,
+        any_client,
+        expected_annotation_sideloaded,
+        dummy_annotation_with_sideloads,
+        mock_generator,
     ):
-        client, http_client = elis_client_sync
+        client, http_client = any_client
         http_client.fetch_all.return_value = mock_generator(dummy_annotation_with_sideloads)
 
-        annotations = client.list_all_annotations(
-            sideloads=["documents", "automation_blockers", "content", "modifiers"],
-            content_schema_ids=["325164"],
+        annotations = await resolve(
+            client,
+            client.list_all_annotations(
+                sideloads=SIDELOADS, content_schema_ids=CONTENT_SCHEMA_IDS
+            ),
         )
 
-        for a in annotations:
-            annotation = Annotation(**dummy_annotation_with_sideloads)
-            modifier = User(**annotation.modifier)
-            annotation.modifier = modifier
-            automation_blocker = Document(**annotation.document)
-            annotation.document = automation_blocker
-            automation_blocker = AutomationBlocker(**annotation.automation_blocker)
-            automation_blocker.content = [
-                AutomationBlockerContent(**content) for content in automation_blocker.content
-            ]
-            annotation.automation_blocker = automation_blocker
-            annotation.content = [
-                AutomationBlockerContent(**content) for content in annotation.content
-            ]
-            assert a == annotation
-
-        http_client.fetch_all.assert_called_with(
-            Resource.Annotation,
-            (),
-            ["documents", "automation_blockers", "content", "modifiers"],
-            ["325164"],
+        assert annotations == [expected_annotation_sideloaded]
+
+        assert http_client.fetch_all.call_args == call(
+            Resource.Annotation, (), SIDELOADS, CONTENT_SCHEMA_IDS
         )
 
-    def test_list_all_annotations_with_content_sideloads_without_schema_ids(
-        self, elis_client_sync
+    async def test_list_all_annotations_with_content_sideloads_without_schema_ids(
+        self, any_client
     ):
-        client, http_client = elis_client_sync
-        http_client.fetch_all = MagicMock()
+        client, http_client = any_client
 
         with pytest.raises(ValueError):
-            for _ in client.list_all_annotations(
-                sideloads=["content"],
-            ):
-                pass
+            await resolve(client, client.list_all_annotations(sideloads=["content"]))
 
         assert not http_client.fetch_all.called
 
-    def test_search_for_annotations(self, elis_client_sync, dummy_annotation, mock_generator):
-        client, http_client = elis_client_sync
-        http_client.fetch_all.return_value = mock_generator(dummy_annotation)
+    async def test_search_for_annotations(
+        self, any_client, dummy_annotation, expected_annotation, mock_generator
+    ):
+        client, http_client = any_client
+        http_client.fetch_all_by_url.return_value = mock_generator(dummy_annotation)
 
-        annotations = client.search_for_annotations({"$and": []}, {"string": "expl"})
+        annotations = await resolve(
+            client, client.search_for_annotations({"$and": []}, {"string": "expl"})
+        )
 
-        for a in annotations:
-            assert a == Annotation(**dummy_annotation)
+        assert annotations == [expected_annotation]
 
-        http_client.fetch_all_by_url.assert_called_with(
+        assert http_client.fetch_all_by_url.call_args == call(
             "annotations/search",
             (),
             (),
@@ -467,187 +408,130 @@ class TestAnnotationsSync:
             method="POST",
         )
 
-    def test_retrieve_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.fetch_one.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        annotation = client.retrieve_annotation(aid)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.fetch_one.assert_called_with(Resource.Annotation, aid)
-
-    def test_retrieve_annotation_with_sideloads(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.return_value = dummy_annotation.copy()
-        http_client.request_json.return_value = {"content": []}
+    async def test_retrieve_annotation_with_sideloads(
+        self,
+        any_client,
+        dummy_annotation,
+        dummy_annotation_payload,
+        expected_annotation_content_sideloaded,
+    ):
+        client, http_client = any_client
+        http_client.fetch_one.return_value = dummy_annotation_payload
+        http_client.request_json.return_value = EMPTY_CONTENT
 
         aid = dummy_annotation["id"]
-        annotation = client.retrieve_annotation(aid, sideloads=["content"])
+        annotation = await resolve(client, client.retrieve_annotation(aid, sideloads=["content"]))
 
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
+        assert annotation == expected_annotation_content_sideloaded
 
-        http_client.fetch_one.assert_called_with(Resource.Annotation, aid)
+        assert http_client.fetch_one.call_args == call(Resource.Annotation, aid)
 
-    def test_poll_annotation(self, elis_client_sync, dummy_annotation):
+    async def test_poll_annotation(
+        self,
+        any_client,
+        dummy_annotation,
+        dummy_annotation_payload,
+        expected_annotation_content_sideloaded,
+        in_progress_annotation,
+        no_sleep,
+    ):
         def is_imported(annotation):
             return annotation.status not in ("importing", "created")
 
-        client, http_client = elis_client_sync
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
+        client, http_client = any_client
         # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy(), []]
+        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation_payload]
         # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
+        http_client.request_json.return_value = EMPTY_CONTENT
 
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = client.poll_annotation(
+        annotation = await resolve(
+            client,
+            client.poll_annotation(
                 dummy_annotation["id"], is_imported, sleep_s=2, sideloads=["content"]
-            )
+            ),
+        )
 
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
+        assert annotation == expected_annotation_content_sideloaded
 
-        sleep_mock.assert_called_once_with(2)
+        assert no_sleep == [2]
 
-    def test_poll_annotation_until_imported(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
+    async def test_poll_annotation_until_imported(
+        self,
+        any_client,
+        dummy_annotation,
+        dummy_annotation_payload,
+        expected_annotation_content_sideloaded,
+        in_progress_annotation,
+        no_sleep,
+    ):
+        client, http_client = any_client
         # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy(), []]
+        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation_payload]
         # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
+        http_client.request_json.return_value = EMPTY_CONTENT
 
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = client.poll_annotation_until_imported(
+        annotation = await resolve(
+            client,
+            client.poll_annotation_until_imported(
                 dummy_annotation["id"], sleep_s=2, sideloads=["content"]
-            )
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-
-        sleep_mock.assert_called_once_with(2)
+            ),
+        )
 
-    def test_upload_and_wait_until_imported(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        in_progress_annotation = {**dummy_annotation, "status": "importing"}
+        assert annotation == expected_annotation_content_sideloaded
+        assert no_sleep == [2]
+
+    async def test_upload_and_wait_until_imported(
+        self,
+        any_client,
+        dummy_annotation,
+        dummy_annotation_payload,
+        expected_annotation_content_sideloaded,
+        in_progress_annotation,
+        no_sleep,
+    ):
+        client, http_client = any_client
         # Mock uploading a document
         http_client.upload.side_effect = [
             {"results": [{"annotation": f"/annotation/{dummy_annotation['id']}"}]}
         ]
         # First, return annotation in importing, than to_review state
-        # Copy the annotation to prevent changing dummy_annotation by side effects
-        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation.copy()]
+        http_client.fetch_one.side_effect = [in_progress_annotation, dummy_annotation_payload]
         # Return sideloaded content
-        http_client.request_json.return_value = {"content": []}
+        http_client.request_json.return_value = EMPTY_CONTENT
 
-        with patch("asyncio.sleep") as sleep_mock:
-            annotation = client.upload_and_wait_until_imported(
+        annotation = await resolve(
+            client,
+            client.upload_and_wait_until_imported(
                 queue_id=8199,
                 filepath="tests/data/sample_invoice.pdf",
                 filename="document.pdf",
                 sleep_s=2,
                 sideloads=["content"],
-            )
-
-        assert annotation == Annotation(**{**dummy_annotation, "content": []})
-
-        sleep_mock.assert_called_once_with(2)
-
-    def test_start_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.replace.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-
-        client.start_annotation(aid)
-        http_client.request_json.assert_called_with("POST", f"annotations/{aid}/start")
-
-    def test_update_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.replace.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        data = {
-            "document": "https://elis.rossum.ai/api/v1/documents/315877",
-            "queue": "https://elis.rossum.ai/api/v1/queues/8236",
-            "status": "postponed",
-        }
-        annotation = client.update_annotation(aid, data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.replace.assert_called_with(Resource.Annotation, aid, data)
-
-    def test_update_part_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.update.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        data = {
-            "status": "deleted",
-        }
-        annotation = client.update_part_annotation(aid, data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.update.assert_called_with(Resource.Annotation, aid, data)
-
-    def test_bulk_update_annotation_data(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.request_json.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-        operations = [{"id": 2510559656, "op": "remove"}, {"id": 2510559657, "op": "remove"}]
-        client.bulk_update_annotation_data(aid, operations)
-
-        http_client.request_json.assert_called_with(
-            "POST", f"annotations/{aid}/content/operations", json={"operations": operations}
-        )
-
-    def test_confirm_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.replace.return_value = dummy_annotation
-
-        aid = dummy_annotation["id"]
-
-        client.confirm_annotation(aid)
-        http_client.request_json.assert_called_with("POST", f"annotations/{aid}/confirm")
-
-    def test_create_new_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-        http_client.create.return_value = dummy_annotation
-
-        data = {
-            "status": "created",
-            "document": dummy_annotation["document"],
-            "queue": dummy_annotation["queue"],
-        }
-        annotation = client.create_new_annotation(data)
-
-        assert annotation == Annotation(**dummy_annotation)
-
-        http_client.create.assert_called_with(Resource.Annotation, data)
-
-    def test_delete_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
-
-        aid = dummy_annotation["id"]
-        client.delete_annotation(aid)
-
-        http_client.request.assert_called_with(
-            "POST", url=f"{Resource.Annotation.value}/{aid}/delete"
+            ),
         )
 
-    def test_cancel_annotation(self, elis_client_sync, dummy_annotation):
-        client, http_client = elis_client_sync
+        assert annotation == expected_annotation_content_sideloaded
+
+        assert no_sleep == [2]
+
+    @pytest.mark.parametrize(
+        "method, args, http_method, expected_call, returns_annotation", CRUD_CASES
+    )
+    async def test_crud(
+        self,
+        any_client,
+        dummy_annotation,
+        expected_annotation,
+        method,
+        args,
+        http_method,
+        expected_call,
+        returns_annotation,
+    ):
+        client, http_client = any_client
+        getattr(http_client, http_method).return_value = dummy_annotation
 
-        aid = dummy_annotation["id"]
-        client.cancel_annotation(aid)
+        result = await resolve(client, getattr(client, method)(*args))
 
-        http_client.request.assert_called_with(
-            "POST", url=f"{Resource.Annotation.value}/{aid}/cancel"
-        )
+        assert result == (expected_annotation if returns_annotation else None)
+        assert getattr(http_client, http_method).call_args == expected_call
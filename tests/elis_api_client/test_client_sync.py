@@ -4,6 +4,11 @@ import httpx
 import pytest
 
 
+@pytest.fixture(scope="module")
+def canned_response():
+    return httpx.Response(200, content=b"some content")
+
+
 class TestClientSync:
     def test_request_paginated(self, elis_client_sync, mock_generator):
         client, http_client = elis_client_sync
@@ -27,9 +32,9 @@ class TestClientSync:
         assert data == {"some": "json"}
         http_client.request_json.assert_called_with("GET", *args, **kwargs)
 
-    def test_request(self, elis_client_sync):
+    def test_request(self, elis_client_sync, canned_response):
         client, http_client = elis_client_sync
-        http_client.request.return_value = httpx.Response(200, content=b"some content")
+        http_client.request.return_value = canned_response
         args = ["some/non/standard/url"]
         kwargs = {"whatever": "kwarg"}
         data = client.request("GET", *args, **kwargs)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
 
 from rossum_api.domain_logic.resources import Resource
 from rossum_api.models.connector import Connector
 
-
-@pytest.fixture
-def dummy_connector():
-    return {
+# Read-only, so that every test can share the same payload
+DUMMY_CONNECTOR = MappingProxyType(
+    {
         "id": 1500,
         "name": "MyQ Connector",
         "queues": ["https://elis.rossum.ai/api/v1/queues/8199"],
@@ -20,6 +21,14 @@ def dummy_connector():
         "asynchronous": True,
         "metadata": {},
     }
+)
+
+EXPECTED_CONNECTOR = Connector(**DUMMY_CONNECTOR)
+
+
+@pytest.fixture
+def dummy_connector():
+    return DUMMY_CONNECTOR
 
 
 @pytest.mark.asyncio
@@ -30,12 +39,10 @@ class TestConnectors:
 
         connectors = client.list_all_connectors()
 
-        async for c in connectors:
-            assert c == Connector(**dummy_connector)
+        assert [c async for c in connectors] == [EXPECTED_CONNECTOR]
 
         http_client.fetch_all.assert_called_with(Resource.Connector, ())
 
-    @pytest.mark.asyncio
     async def test_retrieve_connector(self, elis_client, dummy_connector):
         client, http_client = elis_client
         http_client.fetch_one.return_value = dummy_connector
@@ -43,7 +50,7 @@ class TestConnectors:
         cid = dummy_connector["id"]
         connector = await client.retrieve_connector(cid)
 
-        assert connector == Connector(**dummy_connector)
+        assert connector == EXPECTED_CONNECTOR
 
         http_client.fetch_one.assert_called_with(Resource.Connector, cid)
 
@@ -59,7 +66,7 @@ class TestConnectors:
         }
         connector = await client.create_new_connector(data)
 
-        assert connector == Connector(**dummy_connector)
+        assert connector == EXPECTED_CONNECTOR
 
         http_client.create.assert_called_with(Resource.Connector, data)
 
@@ -71,8 +78,7 @@ class TestConnectorsSync:
 
         connectors = client.list_all_connectors()
 
-        for c in connectors:
-            assert c == Connector(**dummy_connector)
+        assert list(connectors) == [EXPECTED_CONNECTOR]
 
         http_client.fetch_all.assert_called_with(Resource.Connector, ())
 
@@ -83,7 +89,7 @@ class TestConnectorsSync:
         cid = dummy_connector["id"]
         connector = client.retrieve_connector(cid)
 
-        assert connector == Connector(**dummy_connector)
+        assert connector == EXPECTED_CONNECTOR
 
         http_client.fetch_one.assert_called_with(Resource.Connector, cid)
 
@@ -99,6 +105,6 @@ class TestConnectorsSync:
         }
         connector = client.create_new_connector(data)
 
-        assert connector == Connector(**dummy_connector)
+        assert connector == EXPECTED_CONNECTOR
 
         http_client.create.assert_called_with(Resource.Connector, data)
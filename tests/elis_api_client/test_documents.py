@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import pathlib
 
 import httpx
 import pytest
@@ -9,10 +10,15 @@ from rossum_api.domain_logic.resources import Resource
 from rossum_api.models.document import Document
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def file_data() -> bytes:
-    with open("tests/data/sample_invoice.pdf", "rb") as f:
-        return f.read()
+    return (pathlib.Path(__file__).parent.parent / "data" / "sample_invoice.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pdf_response(file_data) -> httpx.Response:
+    # The content is already in memory, reading it does not consume the response
+    return httpx.Response(status_code=200, content=file_data)
 
 
 @pytest.fixture
@@ -48,9 +54,9 @@ class TestDocuments:
 
         http_client.fetch_one.assert_called_with(Resource.Document, did)
 
-    async def test_retrieve_document_content(self, elis_client, file_data):
+    async def test_retrieve_document_content(self, elis_client, file_data, pdf_response):
         client, http_client = elis_client
-        http_client.request.return_value = httpx.Response(status_code=200, content=file_data)
+        http_client.request.return_value = pdf_response
 
         document_id = 123
         result = await client.retrieve_document_content(document_id=document_id)
@@ -93,9 +99,9 @@ class TestDocumentsSync:
 
         http_client.fetch_one.assert_called_with(Resource.Document, did)
 
-    def test_retrieve_document_content(self, elis_client_sync, file_data):
+    def test_retrieve_document_content(self, elis_client_sync, file_data, pdf_response):
         client, http_client = elis_client_sync
-        http_client.request.return_value = httpx.Response(status_code=200, content=file_data)
+        http_client.request.return_value = pdf_response
 
         document_id = 123
         result = client.retrieve_document_content(document_id=document_id)
@@ -59,7 +59,7 @@ class TestOrganizations:
         assert organization == Organization(**dummy_organization)
 
         http_client.fetch_one.assert_has_calls(
-            [call(Resource.Auth, "user"), call(Resource.Organization, "406")]
+            [call(Resource.Auth, "user"), call(Resource.Organization, 406)]
         )
 
 
@@ -95,5 +95,5 @@ class TestOrganizationsSync:
         assert organization == Organization(**dummy_organization)
 
         http_client.fetch_one.assert_has_calls(
-            [call(Resource.Auth, "user"), call(Resource.Organization, "406")]
+            [call(Resource.Auth, "user"), call(Resource.Organization, 406)]
         )
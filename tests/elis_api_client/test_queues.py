@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, call, patch
+import asyncio
+import pathlib
+from unittest.mock import AsyncMock, call
 
 import pytest
 
@@ -9,6 +11,8 @@ from rossum_api.models.annotation import Annotation
 from rossum_api.models.queue import Queue
 from rossum_api.models.task import Task, TaskStatus, TaskType
 
+SAMPLE_INVOICE = pathlib.Path(__file__).parent.parent / "data" / "sample_invoice.pdf"
+
 
 @pytest.fixture
 def dummy_annotation():
@@ -119,27 +123,75 @@ class TestQueues:
 
         http_client.upload.side_effect = upload
 
-        open_mock_first = MagicMock()
-        open_mock_second = MagicMock()
-        fp_mock = MagicMock()
-        fp_mock.__aenter__.side_effect = [open_mock_first, open_mock_second]
-
-        with patch("aiofiles.open", return_value=fp_mock):
-            files = [
-                ("tests/data/sample_invoice.pdf", "document.pdf"),
-                ("tests/data/sample_invoice.pdf", "document 🎁.pdf"),
-            ]
-            annotation_ids = await client.import_document(
-                queue_id=123, files=files, values={"a": 1}, metadata={"b": 2}
-            )
+        files = [
+            (SAMPLE_INVOICE, "document.pdf"),
+            (str(SAMPLE_INVOICE), "document 🎁.pdf"),
+        ]
+        annotation_ids = await client.import_document(
+            queue_id=123, files=files, values={"a": 1}, metadata={"b": 2}
+        )
 
         assert annotation_ids == [111, 222]
+        content = SAMPLE_INVOICE.read_bytes()
         calls = [
-            call(Resource.Queue, 123, open_mock_first, "document.pdf", {"a": 1}, {"b": 2}),
-            call(Resource.Queue, 123, open_mock_second, "document 🎁.pdf", {"a": 1}, {"b": 2}),
+            call(Resource.Queue, 123, content, "document.pdf", {"a": 1}, {"b": 2}),
+            call(Resource.Queue, 123, content, "document 🎁.pdf", {"a": 1}, {"b": 2}),
         ]
         http_client.upload.assert_has_calls(calls, any_order=True)
 
+    async def test_import_document_from_bytes(self, elis_client):
+        client, http_client = elis_client
+        http_client.upload.return_value = {
+            "results": [
+                {
+                    "annotation": "https://elis.rossum.ai/api/v1/annotations/111",
+                    "document": "https://elis.rossum.ai/api/v1/documents/315",
+                }
+            ]
+        }
+
+        annotation_ids = await client.import_document(
+            queue_id=123, files=[(b"Fake PDF.", "document.pdf")]
+        )
+
+        assert annotation_ids == [111]
+        http_client.upload.assert_called_once_with(
+            Resource.Queue, 123, b"Fake PDF.", "document.pdf", None, None
+        )
+
+    async def test_import_document_limits_in_flight_uploads(self, elis_client):
+        client, http_client = elis_client
+        concurrency = {"current": 0, "max": 0}
+
+        async def upload(*args, **kwargs):
+            concurrency["current"] += 1
+            concurrency["max"] = max(concurrency["current"], concurrency["max"])
+            await asyncio.sleep(0)  # let the other uploads start if the limit allows them to
+            concurrency["current"] -= 1
+            return {"results": [{"annotation": "https://elis.rossum.ai/api/v1/annotations/111"}]}
+
+        http_client.upload.side_effect = upload
+
+        files = [(b"Fake PDF.", f"document_{i}.pdf") for i in range(5)]
+        annotation_ids = await client.import_document(
+            queue_id=123, files=files, max_in_flight_uploads=2
+        )
+
+        assert annotation_ids == [111] * 5
+        assert concurrency["max"] == 2
+
+    @pytest.mark.parametrize("method", ["import_document", "upload_document"])
+    async def test_upload_rejects_non_positive_in_flight_limit(self, elis_client, method):
+        client, http_client = elis_client
+
+        with pytest.raises(ValueError, match="max_in_flight_uploads"):
+            await getattr(client, method)(
+                queue_id=123, files=[(b"Fake PDF.", "document.pdf")], max_in_flight_uploads=0
+            )
+
+        http_client.upload.assert_not_called()
+        http_client.request_json.assert_not_called()
+
     async def test_create_upload(self, elis_client):
         client, http_client = elis_client
 
@@ -282,28 +334,35 @@ class TestQueuesSync:
 
         http_client.upload.side_effect = upload
 
-        open_mock_first = MagicMock()
-        open_mock_second = MagicMock()
-        fp_mock = MagicMock()
-        fp_mock.__aenter__.side_effect = [open_mock_first, open_mock_second]
-
-        with patch("aiofiles.open", return_value=fp_mock):
-            files = [
-                ("tests/data/sample_invoice.pdf", "document.pdf"),
-                ("tests/data/sample_invoice.pdf", "document 🎁.pdf"),
-            ]
-            annotation_ids = client.import_document(
-                queue_id=123, files=files, values={"a": 1}, metadata={"b": 2}
-            )
+        files = [
+            (SAMPLE_INVOICE, "document.pdf"),
+            (str(SAMPLE_INVOICE), "document 🎁.pdf"),
+        ]
+        annotation_ids = client.import_document(
+            queue_id=123, files=files, values={"a": 1}, metadata={"b": 2}
+        )
 
         assert annotation_ids == [111, 222]
+        content = SAMPLE_INVOICE.read_bytes()
         calls = [
-            call(Resource.Queue, 123, open_mock_first, "document.pdf", {"a": 1}, {"b": 2}),
-            call(Resource.Queue, 123, open_mock_second, "document 🎁.pdf", {"a": 1}, {"b": 2}),
+            call(Resource.Queue, 123, content, "document.pdf", {"a": 1}, {"b": 2}),
+            call(Resource.Queue, 123, content, "document 🎁.pdf", {"a": 1}, {"b": 2}),
         ]
 
         http_client.upload.assert_has_calls(calls, any_order=True)
 
+    @pytest.mark.parametrize("method", ["import_document", "upload_document"])
+    def test_upload_rejects_non_positive_in_flight_limit(self, elis_client_sync, method):
+        client, http_client = elis_client_sync
+
+        with pytest.raises(ValueError, match="max_in_flight_uploads"):
+            getattr(client, method)(
+                queue_id=123, files=[(b"Fake PDF.", "document.pdf")], max_in_flight_uploads=0
+            )
+
+        http_client.upload.assert_not_called()
+        http_client.request_json.assert_not_called()
+
     def test_delete_queue(self, elis_client_sync, dummy_queue):
         client, http_client = elis_client_sync
         http_client.delete.return_value = None
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from unittest.mock import patch
-
 import pytest
 
 from rossum_api.domain_logic.resources import Resource
@@ -50,19 +48,18 @@ class TestTasks:
             Resource.Task, uid, request_params={"no_redirect": "True"}
         )
 
-    async def test_poll_task(self, elis_client, dummy_task):
+    async def test_poll_task(self, elis_client, dummy_task, no_sleep):
         client, http_client = elis_client
         running_task = {**dummy_task, "status": TaskStatus.RUNNING}
         http_client.fetch_one.side_effect = [running_task, dummy_task.copy()]
 
-        with patch("asyncio.sleep") as sleep_mock:
-            task = await client.poll_task(
-                dummy_task["id"], lambda a: a.status == TaskStatus.SUCCEEDED, sleep_s=2
-            )
+        task = await client.poll_task(
+            dummy_task["id"], lambda a: a.status == TaskStatus.SUCCEEDED, sleep_s=2
+        )
 
         assert task == Task(**{**dummy_task})
 
-        sleep_mock.assert_called_once_with(2)
+        assert no_sleep == [2]
 
 
 class TestTasksSync:
@@ -92,16 +89,15 @@ class TestTasksSync:
             Resource.Task, uid, request_params={"no_redirect": "True"}
         )
 
-    def test_poll_task(self, elis_client_sync, dummy_task):
+    def test_poll_task(self, elis_client_sync, dummy_task, no_sleep):
         client, http_client = elis_client_sync
         running_task = {**dummy_task, "status": TaskStatus.RUNNING}
         http_client.fetch_one.side_effect = [running_task, dummy_task.copy()]
 
-        with patch("asyncio.sleep") as sleep_mock:
-            task = client.poll_task(
-                dummy_task["id"], lambda a: a.status == TaskStatus.SUCCEEDED, sleep_s=2
-            )
+        task = client.poll_task(
+            dummy_task["id"], lambda a: a.status == TaskStatus.SUCCEEDED, sleep_s=2
+        )
 
         assert task == Task(**{**dummy_task})
 
-        sleep_mock.assert_called_once_with(2)
+        assert no_sleep == [2]
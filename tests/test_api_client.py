@@ -11,6 +11,7 @@ import asyncio
 import contextlib
 import copy
 import functools
+import io
 import json
 import unittest.mock as mock
 
@@ -20,7 +21,7 @@ import pytest
 import pytest_httpx
 from conftest import ANNOTATIONS, AUTOMATION_BLOCKERS, CONTENT
 
-from rossum_api.api_client import APIClient, APIClientError
+from rossum_api.api_client import APIClient, APIClientError, _default_ssl_context
 from rossum_api.domain_logic.resources import Resource
 
 WORKSPACES = [
@@ -87,6 +88,16 @@ def count_calls(func):
     return count_calls_
 
 
+class FileLike:
+    """A minimal binary file-like object that is not an io.IOBase subclass."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
 @pytest.fixture
 def client():
     # Set retrying parameters to zero to keep tests fast
@@ -108,6 +119,12 @@ def login_mock(httpx_mock):
     return httpx_mock
 
 
+def test_ssl_context_is_shared_per_http_version():
+    assert _default_ssl_context(False) is _default_ssl_context(False)
+    # httpcore sets the ALPN protocols on the context, HTTP/2 clients need a context of their own
+    assert _default_ssl_context(True) is not _default_ssl_context(False)
+
+
 @pytest.mark.asyncio
 async def test_authenticate(client, login_mock):
     assert client.token != "our-token"
@@ -159,6 +176,20 @@ async def test_init_token(httpx_mock):
     assert httpx_mock.get_requests()[0].headers["Authorization"] == f"token {FAKE_TOKEN}"
 
 
+@pytest.mark.asyncio
+async def test_context_manager_closes_connection_pool(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://elis.rossum.ai/api/v1/users/1",
+        json=USER,
+    )
+    async with APIClient(token=FAKE_TOKEN) as client:
+        assert await client.fetch_one(Resource.User, 1) == USER
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
+
+
 @pytest.mark.asyncio
 async def test_reauth_no_credentials(httpx_mock):
     """Invalid token used but no credentials available for re-authentication. Raise 401."""
@@ -316,18 +347,18 @@ async def test_fetch_all_filters(client, httpx_mock):
 
 
 @pytest.mark.asyncio
-async def test_fetch_all_sideload(client, httpx_mock):
+async def test_fetch_all_sideload(client, httpx_mock, annotations):
     httpx_mock.add_response(
         method="GET",
         url="https://elis.rossum.ai/api/v1/annotations?page_size=100&sideload=content,automation_blockers&content.schema_id=invoice_id,date_issue&ordering=",
         json={
             "pagination": {"total": 3, "total_pages": 1, "next": None, "previous": None},
-            "results": ANNOTATIONS,
+            "results": annotations,
             "content": CONTENT,
             "automation_blockers": AUTOMATION_BLOCKERS,
         },
     )
-    annotations = [
+    fetched_annotations = [
         w
         async for w in client.fetch_all(
             Resource.Annotation,
@@ -336,14 +367,14 @@ async def test_fetch_all_sideload(client, httpx_mock):
         )
     ]
 
-    expected_annotations = copy.deepcopy(ANNOTATIONS)
+    expected_annotations = copy.deepcopy(annotations)
     expected_annotations[0]["content"] = [CONTENT[1]]
     expected_annotations[0]["automation_blocker"] = AUTOMATION_BLOCKERS[0]
     expected_annotations[1]["content"] = [CONTENT[0], CONTENT[2]]
     expected_annotations[1]["automation_blocker"] = AUTOMATION_BLOCKERS[0]
     expected_annotations[2]["content"] = []
 
-    assert annotations == expected_annotations
+    assert fetched_annotations == expected_annotations
 
 
 @pytest.mark.asyncio
@@ -411,6 +442,31 @@ async def test_fetch_all_limit_in_flight_requests(client, httpx_mock):
         assert concurrency["max"] == 3, "based on overridden max_in_flight_requests to 3"
 
 
+@pytest.mark.asyncio
+async def test_fetch_many(client, httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://elis.rossum.ai/api/v1/workspaces?page_size=100&ordering=&sideload=&content.schema_id=&id=7694,1234",
+        json={
+            "pagination": {"total": 2, "total_pages": 1, "next": None, "previous": None},
+            "results": WORKSPACES[:2],
+        },
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://elis.rossum.ai/api/v1/workspaces?page_size=100&ordering=&sideload=&content.schema_id=&id=4321",
+        json={
+            "pagination": {"total": 1, "total_pages": 1, "next": None, "previous": None},
+            "results": WORKSPACES[2:],
+        },
+    )
+    workspaces = [
+        w async for w in client.fetch_many(Resource.Workspace, [7694, 1234, 4321], batch_size=2)
+    ]
+    assert workspaces == WORKSPACES
+    assert len(httpx_mock.get_requests()) == 2
+
+
 @pytest.mark.asyncio
 async def test_create(client, httpx_mock):
     data = {
@@ -493,6 +549,32 @@ async def test_upload(client, httpx_mock):
     assert response == UPLOAD_RESPONSE
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fp",
+    [io.BytesIO(b"Fake PDF."), FileLike(b"Fake PDF."), b"Fake PDF."],
+    ids=["BytesIO", "file-like", "bytes"],
+)
+async def test_upload_regular_file_or_bytes(client, httpx_mock, fp):
+    httpx_mock.add_response(
+        method="POST",
+        url="https://elis.rossum.ai/api/v1/queues/123/upload",
+        match_content=EXPECTED_UPLOAD_CONTENT,
+        json=UPLOAD_RESPONSE,
+    )
+
+    with mock.patch("httpx._multipart.os.urandom", return_value=b"111"):
+        response = await client.upload(
+            Resource.Queue,
+            id_=123,
+            fp=fp,
+            filename="filename.pdf",
+            values={"upload:organization_unit": "Sales"},
+            metadata={"project": "Market ABC"},
+        )
+    assert response == UPLOAD_RESPONSE
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "filters,expected_method, first_url, second_url",
@@ -722,6 +804,35 @@ async def test_stream_repacks_exception(client, httpx_mock):
     )
 
 
+@pytest.mark.asyncio
+async def test_custom_transport():
+    def handler(request):
+        return httpx.Response(200, json=WORKSPACES[0])
+
+    async with APIClient(token=FAKE_TOKEN, transport=httpx.MockTransport(handler)) as client:
+        workspace = await client.fetch_one(Resource.Workspace, id_=7694)
+    assert workspace == WORKSPACES[0]
+
+
+@pytest.mark.asyncio
+async def test_warmup_authenticates_without_token(client, login_mock):
+    client.token = None
+    await client.warmup()
+    assert client.token == NEW_TOKEN
+
+
+@pytest.mark.asyncio
+async def test_warmup_ignores_response_status(client, httpx_mock):
+    httpx_mock.add_response(
+        method="HEAD",
+        url="https://elis.rossum.ai/api/v1",
+        match_headers={"Authorization": f"token {FAKE_TOKEN}"},
+        status_code=404,
+    )
+    await client.warmup()
+    assert client.token == FAKE_TOKEN
+
+
 @pytest.mark.asyncio
 async def test_get_token_new(client, login_mock):
     client.token = None